@@ -0,0 +1,69 @@
+"""
+Shared fixtures for the benchmark suite.
+
+  uv run --group bench pytest benchmarks                       # run
+  uv run --group bench pytest benchmarks --benchmark-save=NAME  # local baseline
+  uv run --group bench pytest benchmarks --benchmark-compare \\
+    --benchmark-compare-fail=median:25%                         # compare
+
+Baselines only make sense on the machine that recorded them, so none are
+committed: CI saves one on each push to main and compares pull requests
+against it (.github/workflows/benchmarks.yml).
+
+Library size is set with ZOTERO_TUI_BENCH_ITEMS (default 5000).
+"""
+
+import asyncio
+import os
+from pathlib import Path
+from typing import Any, Callable
+
+import pytest
+
+from synthetic_db import LibrarySpec, generate_library
+from zotero_tui.database.connection import ZoteroDB
+from zotero_tui.database.models import ZoteroItem
+from zotero_tui.database.queries import fetch_all_items
+
+
+BENCH_ITEMS = int(os.environ.get("ZOTERO_TUI_BENCH_ITEMS", "5000"))
+
+
+@pytest.fixture(scope="session")
+def library_db(tmp_path_factory: pytest.TempPathFactory) -> Path:
+  spec = LibrarySpec(
+    items=BENCH_ITEMS,
+    attachments_per_item=1,
+    groups=2,
+    fulltext_words=2000,
+    words_per_attachment=20,
+  )
+  library = generate_library(tmp_path_factory.mktemp("zotero") / "zotero.sqlite", spec)
+  return library.path
+
+
+@pytest.fixture(scope="session")
+def zotero_db(library_db: Path) -> ZoteroDB:
+  return ZoteroDB(library_db)
+
+
+@pytest.fixture(scope="session")
+def items(zotero_db: ZoteroDB) -> list[ZoteroItem]:
+  with zotero_db.connect() as conn:
+    return list(fetch_all_items(conn))
+
+
+@pytest.fixture
+def run_in_app(zotero_db: ZoteroDB) -> Callable[[Callable[[Any], None]], None]:
+  """Runs `body(app)` inside a headless, mounted ZoteroApp."""
+  from zotero_tui.ui.app import ZoteroApp
+
+  def run(body: Callable[[Any], None]) -> None:
+    async def main() -> None:
+      app = ZoteroApp(db=zotero_db)
+      async with app.run_test(size=(160, 50)):
+        body(app)
+
+    asyncio.run(main())
+
+  return run
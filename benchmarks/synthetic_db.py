@@ -0,0 +1,491 @@
+"""
+Writes a synthetic `zotero.sqlite` for benchmarking.
+
+The tables and columns follow the real Zotero schema for everything
+zotero-tui reads (items, item data, creators, attachments, trash, group
+libraries and the full-text word index). Output is deterministic for a
+given seed.
+
+  python benchmarks/synthetic_db.py /tmp/zotero.sqlite --items 50000
+"""
+
+import argparse
+import random
+import sqlite3
+from dataclasses import dataclass
+from pathlib import Path
+from typing import NamedTuple
+
+
+SCHEMA = """
+CREATE TABLE libraries (
+  libraryID INTEGER PRIMARY KEY,
+  type TEXT NOT NULL,
+  editable INT NOT NULL,
+  filesEditable INT NOT NULL,
+  version INT NOT NULL DEFAULT 0,
+  storageVersion INT NOT NULL DEFAULT 0,
+  lastSync INT NOT NULL DEFAULT 0,
+  archived INT NOT NULL DEFAULT 0
+);
+CREATE TABLE groups (
+  groupID INTEGER PRIMARY KEY,
+  libraryID INT NOT NULL UNIQUE,
+  name TEXT NOT NULL,
+  description TEXT NOT NULL,
+  version INT NOT NULL
+);
+CREATE TABLE itemTypes (
+  itemTypeID INTEGER PRIMARY KEY,
+  typeName TEXT,
+  templateItemTypeID INT,
+  display INT DEFAULT 1
+);
+CREATE TABLE fields (
+  fieldID INTEGER PRIMARY KEY,
+  fieldName TEXT,
+  fieldFormatID INT
+);
+CREATE TABLE items (
+  itemID INTEGER PRIMARY KEY,
+  itemTypeID INT NOT NULL,
+  dateAdded TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  dateModified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  clientDateModified TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+  libraryID INT NOT NULL,
+  key TEXT NOT NULL,
+  version INT NOT NULL DEFAULT 0,
+  synced INT NOT NULL DEFAULT 0,
+  UNIQUE (libraryID, key)
+);
+CREATE TABLE itemDataValues (
+  valueID INTEGER PRIMARY KEY,
+  value UNIQUE
+);
+CREATE TABLE itemData (
+  itemID INT,
+  fieldID INT,
+  valueID,
+  PRIMARY KEY (itemID, fieldID)
+);
+CREATE INDEX itemData_fieldID ON itemData(fieldID);
+CREATE TABLE creators (
+  creatorID INTEGER PRIMARY KEY,
+  firstName TEXT,
+  lastName TEXT,
+  fieldMode INT,
+  UNIQUE (lastName, firstName, fieldMode)
+);
+CREATE TABLE creatorTypes (
+  creatorTypeID INTEGER PRIMARY KEY,
+  creatorType TEXT
+);
+CREATE TABLE itemCreators (
+  itemID INT NOT NULL,
+  creatorID INT NOT NULL,
+  creatorTypeID INT NOT NULL DEFAULT 1,
+  orderIndex INT NOT NULL DEFAULT 0,
+  PRIMARY KEY (itemID, orderIndex),
+  UNIQUE (itemID, creatorID, creatorTypeID)
+);
+CREATE INDEX itemCreators_creatorTypeID ON itemCreators(creatorTypeID);
+CREATE TABLE itemAttachments (
+  itemID INTEGER PRIMARY KEY,
+  parentItemID INT,
+  linkMode INT,
+  contentType TEXT,
+  charsetID INT,
+  path TEXT,
+  syncState INT DEFAULT 0,
+  storageModTime INT,
+  storageHash TEXT,
+  lastProcessedModificationTime INT
+);
+CREATE INDEX itemAttachments_parentItemID ON itemAttachments(parentItemID);
+CREATE TABLE itemNotes (
+  itemID INTEGER PRIMARY KEY,
+  parentItemID INT,
+  note TEXT,
+  title TEXT
+);
+CREATE TABLE deletedItems (
+  itemID INTEGER PRIMARY KEY,
+  dateDeleted DEFAULT CURRENT_TIMESTAMP NOT NULL
+);
+CREATE TABLE fulltextItems (
+  itemID INTEGER PRIMARY KEY,
+  indexedPages INT,
+  totalPages INT,
+  indexedChars INT,
+  totalChars INT,
+  version INT NOT NULL DEFAULT 0,
+  synced INT NOT NULL DEFAULT 0
+);
+CREATE TABLE fulltextWords (
+  wordID INTEGER PRIMARY KEY,
+  word TEXT UNIQUE
+);
+CREATE TABLE fulltextItemWords (
+  wordID INT,
+  itemID INT,
+  PRIMARY KEY (wordID, itemID)
+);
+CREATE INDEX fulltextItemWords_itemID ON fulltextItemWords(itemID);
+"""
+
+# IDs 3, 14 and 28 must match the types filtered out in `fetch_all_items`
+ITEM_TYPES = {
+  "attachment": 3,
+  "book": 7,
+  "bookSection": 8,
+  "conferencePaper": 11,
+  "document": 14,
+  "journalArticle": 22,
+  "note": 28,
+  "preprint": 35,
+}
+REGULAR_TYPES = ["journalArticle", "conferencePaper", "preprint", "book", "bookSection"]
+REGULAR_WEIGHTS = [40, 30, 20, 5, 5]
+
+FIELDS = [
+  "title",
+  "date",
+  "abstractNote",
+  "publicationTitle",
+  "proceedingsTitle",
+  "bookTitle",
+  "repository",
+  "volume",
+  "issue",
+  "pages",
+  "DOI",
+  "publisher",
+  "extra",
+  "url",
+  "accessDate",
+  "libraryCatalog",
+  "language",
+]
+
+WORDS = (
+  "learning deep neural network networks graph attention transformer model models "
+  "optimal transport bayesian inference variational robust adversarial training "
+  "kernel methods generalization bounds stochastic gradient descent convex "
+  "optimization reinforcement policy causal representation language vision "
+  "diffusion generative sparse low rank matrix estimation private federated "
+  "fairness calibration uncertainty efficient scalable theory analysis survey"
+).split()
+FIRST_NAMES = (
+  "Alice Bob Carol David Erin Frank Grace Heidi Ivan Judy Mallory Niaj Olivia "
+  "Peggy Rupert Sybil Trent Victor Walter Yuki Zhang Wei Priya Arjun Fatima Omar"
+).split()
+LAST_NAMES = (
+  "Smith Johnson Williams Brown Jones Garcia Miller Davis Rodriguez Martinez "
+  "Nguyen Kim Tanaka Müller Schmidt Rossi Dubois Silva Cohen Kowalski Ivanov "
+  "Chen Wang Li Patel Singh Khan Okafor Andersson Hansen"
+).split()
+VENUES = {
+  "journalArticle": (
+    "publicationTitle",
+    ["Journal of Machine Learning Research", "Annals of Statistics", "Nature"],
+  ),
+  "conferencePaper": (
+    "proceedingsTitle",
+    ["Advances in Neural Information Processing Systems", "ICML", "ICLR"],
+  ),
+  "bookSection": ("bookTitle", ["Handbook of Statistics", "Lecture Notes in AI"]),
+}
+KEY_ALPHABET = "23456789ABCDEFGHIJKLMNPQRSTUVWXYZ"
+
+
+@dataclass(frozen=True)
+class LibrarySpec:
+  items: int = 1000
+  max_authors: int = 8
+  attachments_per_item: int = 1
+  linked_ratio: float = 0.1  # Share of attachments stored as base-dir links
+  notes_per_item: int = 0
+  deleted_ratio: float = 0.02
+  duplicate_ratio: float = 0.0  # Extra items that re-enter an existing one
+  groups: int = 0
+  fulltext_words: int = 0  # Vocabulary size of fulltextWords
+  words_per_attachment: int = 0
+  seed: int = 0
+
+
+class SyntheticLibrary(NamedTuple):
+  path: Path
+  duplicates: list[tuple[int, int]]  # Planted (source, duplicate) item ids
+
+
+class _Record(NamedTuple):
+  item_id: int
+  title: str
+  year: int
+  doi: str | None
+  creators: tuple[int, ...]
+
+
+class _Writer:
+  """Accumulates rows and deduplicates values/creators like Zotero does."""
+
+  def __init__(self, spec: LibrarySpec) -> None:
+    self.spec = spec
+    self.rng = random.Random(spec.seed)
+    self.keys: set[str] = set()
+    self.next_item_id = 1
+    self.values: dict[str, int] = {}
+    self.creators: dict[tuple[str, str], int] = {}
+    self.field_ids = {name: i for i, name in enumerate(FIELDS, start=1)}
+    self.records: list[_Record] = []
+    self.duplicates: list[tuple[int, int]] = []
+
+    self.items: list[tuple] = []
+    self.item_data: list[tuple] = []
+    self.item_creators: list[tuple] = []
+    self.attachments: list[tuple] = []
+    self.notes: list[tuple] = []
+    self.deleted: list[tuple] = []
+    self.fulltext_items: list[tuple] = []
+    self.fulltext_item_words: set[tuple] = set()
+
+  def new_key(self) -> str:
+    while True:
+      key = "".join(self.rng.choices(KEY_ALPHABET, k=8))
+      if key not in self.keys:
+        self.keys.add(key)
+        return key
+
+  def new_item(self, type_name: str, library_id: int) -> int:
+    item_id = self.next_item_id
+    self.next_item_id += 1
+    self.items.append((item_id, ITEM_TYPES[type_name], library_id, self.new_key()))
+    return item_id
+
+  def set_field(self, item_id: int, field: str, value: str) -> None:
+    value_id = self.values.setdefault(value, len(self.values) + 1)
+    self.item_data.append((item_id, self.field_ids[field], value_id))
+
+  def creator_id(self, first: str, last: str) -> int:
+    return self.creators.setdefault((first, last), len(self.creators) + 1)
+
+  def sentence(self, low: int, high: int) -> str:
+    return " ".join(self.rng.choices(WORDS, k=self.rng.randint(low, high)))
+
+  def add_regular_item(self, library_id: int, source: _Record | None = None) -> None:
+    """
+    Adds a regular item. Given a `source`, the item is a duplicate of it:
+    either a double import or a preprint version of the same paper.
+    """
+    rng = self.rng
+    if source is None:
+      type_name = rng.choices(REGULAR_TYPES, REGULAR_WEIGHTS)[0]
+      year = rng.randint(1990, 2025)
+      title = self.sentence(3, 12).capitalize()
+    elif rng.random() < 0.5:
+      type_name, year, title = "journalArticle", source.year, source.title
+    else:
+      type_name, year = "preprint", source.year - rng.randint(0, 1)
+      title = source.title.lower() + rng.choice(["", ".", "?"])
+
+    item_id = self.new_item(type_name, library_id)
+    self.set_field(item_id, "title", title)
+    self.set_field(item_id, "date", f"{year}-{rng.randint(1, 12):02d}-00 {year}")
+    self.set_field(item_id, "abstractNote", self.sentence(40, 120))
+    self.set_field(item_id, "accessDate", "2024-01-01 00:00:00")
+    self.set_field(item_id, "libraryCatalog", "Synthetic")
+    self.set_field(item_id, "language", "en")
+
+    doi = None
+    if type_name == "preprint":
+      arxiv_id = f"{year % 100:02d}{rng.randint(1, 12):02d}.{rng.randint(0, 99999):05d}"
+      doi = f"10.48550/arXiv.{arxiv_id}"
+      self.set_field(item_id, "repository", "arXiv")
+      self.set_field(item_id, "DOI", doi)
+    elif type_name in VENUES:
+      field, venues = VENUES[type_name]
+      self.set_field(item_id, field, rng.choice(venues))
+      if source is not None and source.doi:
+        doi = source.doi
+      else:
+        doi = f"10.{rng.randint(1000, 9999)}/{self.new_key()}"
+      self.set_field(item_id, "DOI", doi)
+      self.set_field(item_id, "volume", str(rng.randint(1, 40)))
+      self.set_field(item_id, "pages", f"{(p := rng.randint(1, 900))}-{p + 12}")
+    else:
+      self.set_field(item_id, "publisher", "Synthetic Press")
+
+    if source is None:
+      n_authors = rng.randint(1, self.spec.max_authors)
+      creators = tuple(
+        dict.fromkeys(
+          self.creator_id(rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES))
+          for _ in range(n_authors)
+        )
+      )
+    else:
+      creators = source.creators
+    for order, creator in enumerate(creators):
+      self.item_creators.append((item_id, creator, order))
+
+    self.records.append(_Record(item_id, title, year, doi, creators))
+    if source is not None:
+      self.duplicates.append((source.item_id, item_id))
+
+    if rng.random() < self.spec.deleted_ratio:
+      self.deleted.append((item_id,))
+
+    for _ in range(self.spec.attachments_per_item):
+      self.add_attachment(item_id, library_id)
+
+    for _ in range(self.spec.notes_per_item):
+      note_id = self.new_item("note", library_id)
+      self.notes.append((note_id, item_id, f"<p>{self.sentence(5, 30)}</p>", ""))
+
+  def add_attachment(self, parent_id: int, library_id: int) -> None:
+    attachment_id = self.new_item("attachment", library_id)
+    name = f"{self.sentence(2, 4).replace(' ', '_')}.pdf"
+    if self.rng.random() < self.spec.linked_ratio:
+      link_mode, path = 2, f"attachments:papers/{name}"
+    else:
+      link_mode, path = 1, f"storage:{name}"
+    self.attachments.append(
+      (attachment_id, parent_id, link_mode, "application/pdf", path)
+    )
+
+    if self.spec.fulltext_words and self.spec.words_per_attachment:
+      pages = self.rng.randint(4, 40)
+      self.fulltext_items.append((attachment_id, pages, pages))
+      for word_id in self.rng.sample(
+        range(1, self.spec.fulltext_words + 1),
+        min(self.spec.words_per_attachment, self.spec.fulltext_words),
+      ):
+        self.fulltext_item_words.add((word_id, attachment_id))
+
+
+def generate_library(
+  path: Path, spec: LibrarySpec = LibrarySpec()
+) -> SyntheticLibrary:
+  """
+  Writes a synthetic Zotero database to `path` (overwritten) and returns it
+  along with the duplicate pairs that were planted.
+  """
+  path = path.expanduser()
+  path.unlink(missing_ok=True)
+  writer = _Writer(spec)
+
+  library_ids = [1] + [2 + g for g in range(spec.groups)]
+  for i in range(spec.items):
+    # Most items live in the user library, the rest are spread over groups
+    library_id = 1 if i % 4 or len(library_ids) == 1 else writer.rng.choice(library_ids)
+    writer.add_regular_item(library_id)
+
+  for _ in range(int(spec.items * spec.duplicate_ratio)):
+    writer.add_regular_item(1, source=writer.rng.choice(writer.records))
+
+  conn = sqlite3.connect(path)
+  try:
+    conn.executescript(SCHEMA)
+    conn.executemany(
+      "INSERT INTO libraries (libraryID, type, editable, filesEditable)"
+      " VALUES (?, ?, 1, 1)",
+      [(lid, "user" if lid == 1 else "group") for lid in library_ids],
+    )
+    conn.executemany(
+      "INSERT INTO groups VALUES (?, ?, ?, '', 0)",
+      [(1000 + lid, lid, f"Group {lid}") for lid in library_ids[1:]],
+    )
+    conn.executemany(
+      "INSERT INTO itemTypes (itemTypeID, typeName) VALUES (?, ?)",
+      [(type_id, name) for name, type_id in ITEM_TYPES.items()],
+    )
+    conn.executemany(
+      "INSERT INTO fields (fieldID, fieldName) VALUES (?, ?)",
+      [(field_id, name) for name, field_id in writer.field_ids.items()],
+    )
+    conn.executemany(
+      "INSERT INTO creatorTypes VALUES (?, ?)", [(1, "author"), (2, "editor")]
+    )
+    conn.executemany(
+      "INSERT INTO items (itemID, itemTypeID, libraryID, key) VALUES (?, ?, ?, ?)",
+      writer.items,
+    )
+    conn.executemany(
+      "INSERT INTO itemDataValues VALUES (?, ?)",
+      [(value_id, value) for value, value_id in writer.values.items()],
+    )
+    conn.executemany("INSERT INTO itemData VALUES (?, ?, ?)", writer.item_data)
+    conn.executemany(
+      "INSERT INTO creators VALUES (?, ?, ?, 0)",
+      [(cid, first, last) for (first, last), cid in writer.creators.items()],
+    )
+    conn.executemany(
+      "INSERT INTO itemCreators (itemID, creatorID, orderIndex) VALUES (?, ?, ?)",
+      writer.item_creators,
+    )
+    conn.executemany(
+      "INSERT INTO itemAttachments (itemID, parentItemID, linkMode, contentType, path)"
+      " VALUES (?, ?, ?, ?, ?)",
+      writer.attachments,
+    )
+    conn.executemany("INSERT INTO itemNotes VALUES (?, ?, ?, ?)", writer.notes)
+    conn.executemany("INSERT INTO deletedItems (itemID) VALUES (?)", writer.deleted)
+    conn.executemany(
+      "INSERT INTO fulltextWords VALUES (?, ?)",
+      [
+        (i, f"{writer.rng.choice(WORDS)}{i}")
+        for i in range(1, spec.fulltext_words + 1)
+      ],
+    )
+    conn.executemany(
+      "INSERT INTO fulltextItems (itemID, indexedPages, totalPages) VALUES (?, ?, ?)",
+      writer.fulltext_items,
+    )
+    conn.executemany(
+      "INSERT INTO fulltextItemWords VALUES (?, ?)", sorted(writer.fulltext_item_words)
+    )
+    conn.commit()
+  finally:
+    conn.close()
+
+  return SyntheticLibrary(path, writer.duplicates)
+
+
+def main() -> None:
+  defaults = LibrarySpec()
+  parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+  parser.add_argument("path", type=Path)
+  parser.add_argument("--items", type=int, default=defaults.items)
+  parser.add_argument("--max-authors", type=int, default=defaults.max_authors)
+  parser.add_argument(
+    "--attachments-per-item", type=int, default=defaults.attachments_per_item
+  )
+  parser.add_argument("--notes-per-item", type=int, default=defaults.notes_per_item)
+  parser.add_argument("--groups", type=int, default=defaults.groups)
+  parser.add_argument(
+    "--duplicate-ratio", type=float, default=defaults.duplicate_ratio
+  )
+  parser.add_argument("--fulltext-words", type=int, default=defaults.fulltext_words)
+  parser.add_argument(
+    "--words-per-attachment", type=int, default=defaults.words_per_attachment
+  )
+  parser.add_argument("--seed", type=int, default=defaults.seed)
+  args = parser.parse_args()
+
+  spec = LibrarySpec(
+    items=args.items,
+    max_authors=args.max_authors,
+    attachments_per_item=args.attachments_per_item,
+    notes_per_item=args.notes_per_item,
+    groups=args.groups,
+    duplicate_ratio=args.duplicate_ratio,
+    fulltext_words=args.fulltext_words,
+    words_per_attachment=args.words_per_attachment,
+    seed=args.seed,
+  )
+  library = generate_library(args.path, spec)
+  print(f"Wrote {library.path} ({len(library.duplicates)} planted duplicates)")
+
+
+if __name__ == "__main__":
+  main()
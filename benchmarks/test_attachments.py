@@ -0,0 +1,105 @@
+import threading
+from pathlib import Path
+
+from zotero_tui.database.attachments import (
+  AttachmentIndex,
+  AttachmentResolver,
+  AttachmentState,
+  read_zotero_prefs,
+)
+from zotero_tui.database.models import Attachment, ZoteroItem
+
+PDF = "application/pdf"
+
+
+def make_item(*attachments: Attachment) -> ZoteroItem:
+  return ZoteroItem(
+    item_id=1,
+    key="ITEMKEY1",
+    item_type="journalArticle",
+    title="Paper",
+    authors=[],
+    year=2020,
+    attachments=list(attachments),
+  )
+
+
+def refresh_and_wait(index: AttachmentIndex, items: list[ZoteroItem]) -> str:
+  """Runs a refresh and returns the name of the thread `on_done` ran on."""
+  done = threading.Event()
+  thread_name = ""
+
+  def on_done() -> None:
+    nonlocal thread_name
+    thread_name = threading.current_thread().name
+    done.set()
+
+  index.refresh(items, on_done)
+  assert done.wait(5)
+  return thread_name
+
+
+def test_read_zotero_prefs(tmp_path: Path):
+  prefs = tmp_path / "prefs.js"
+  prefs.write_text(
+    "// Mozilla User Preferences\n"
+    'user_pref("extensions.zotero.baseAttachmentPath", "/home/me/papers");\n'
+    'user_pref("extensions.zotero.sync.server.username", "me");\n'
+    'user_pref("extensions.zotero.lastViewedFolder", 3);\n'
+    'user_pref("extensions.zotero.firstRun2", false);\n'
+    'user_pref("broken.value", not-json);\n',
+    encoding="utf-8",
+  )
+
+  assert read_zotero_prefs(prefs) == {
+    "extensions.zotero.baseAttachmentPath": "/home/me/papers",
+    "extensions.zotero.sync.server.username": "me",
+    "extensions.zotero.lastViewedFolder": 3,
+    "extensions.zotero.firstRun2": False,
+  }
+  assert read_zotero_prefs(tmp_path / "missing.js") == {}
+
+
+def test_get_absolute_path():
+  storage, base = Path("/zotero/storage"), Path("/home/me/papers")
+
+  stored = Attachment(Path("storage:paper.pdf"), "ABCD1234", is_link=False)
+  assert stored.get_absolute_path(storage) == storage / "ABCD1234" / "paper.pdf"
+
+  relative = Attachment(Path("attachments:ml/paper.pdf"), "ABCD1234", is_link=True)
+  assert relative.get_absolute_path(storage, base) == base / "ml" / "paper.pdf"
+  assert relative.get_absolute_path(storage) == Path("attachments:ml/paper.pdf")
+
+  absolute = Attachment(Path("/tmp/paper.pdf"), "ABCD1234", is_link=True)
+  assert absolute.get_absolute_path(storage, base) == Path("/tmp/paper.pdf")
+
+
+def test_item_state(tmp_path: Path):
+  (tmp_path / "PRESENT1").mkdir()
+  (tmp_path / "PRESENT1" / "paper.pdf").write_bytes(b"%PDF-1.7")
+  present = Attachment(Path("storage:paper.pdf"), "PRESENT1", False, PDF)
+  missing = Attachment(Path("storage:paper.pdf"), "MISSING1", False, PDF)
+  snapshot = Attachment(Path("storage:page.html"), "PRESENT1", False, "text/html")
+
+  index = AttachmentIndex(AttachmentResolver(storage_base=tmp_path))
+  try:
+    assert index.item_state(make_item()) == AttachmentState.NONE
+    assert index.item_state(make_item(snapshot)) == AttachmentState.NONE
+    assert index.item_state(make_item(present)) == AttachmentState.PENDING
+
+    items = [make_item(present), make_item(missing)]
+    refresh_and_wait(index, items)
+    assert index.item_state(make_item(present)) == AttachmentState.PRESENT
+    assert index.item_state(make_item(missing)) == AttachmentState.MISSING
+    assert index.item_state(make_item(missing, present)) == AttachmentState.PRESENT
+  finally:
+    index.shutdown()
+
+
+def test_refresh_calls_back_on_worker_thread(tmp_path: Path):
+  index = AttachmentIndex(AttachmentResolver(storage_base=tmp_path))
+  try:
+    assert refresh_and_wait(index, []).startswith("zotero-attachments")
+    assert refresh_and_wait(index, [make_item()]).startswith("zotero-attachments")
+  finally:
+    index.shutdown()
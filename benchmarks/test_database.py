@@ -0,0 +1,31 @@
+from pathlib import Path
+
+from zotero_tui.database.connection import ZoteroDB
+from zotero_tui.database.queries import fetch_all_items
+
+
+def test_fetch_all_items(benchmark, zotero_db: ZoteroDB):
+  def load() -> int:
+    with zotero_db.connect() as conn:
+      return len(list(fetch_all_items(conn)))
+
+  assert benchmark.pedantic(load, rounds=5, iterations=1) > 0
+
+
+def test_cold_connect_and_load(benchmark, library_db: Path):
+  """Includes opening the DB, as on app start."""
+
+  def load() -> int:
+    with ZoteroDB(library_db).connect() as conn:
+      return len(list(fetch_all_items(conn)))
+
+  assert benchmark.pedantic(load, rounds=5, iterations=1) > 0
+
+
+def test_refresh(benchmark, run_in_app):
+  """Full library reload as triggered by a DB change."""
+
+  def body(app) -> None:
+    benchmark.pedantic(app.reload_library_data, rounds=5, iterations=1)
+
+  run_in_app(body)
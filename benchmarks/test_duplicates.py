@@ -0,0 +1,67 @@
+import os
+
+import pytest
+
+from synthetic_db import LibrarySpec, SyntheticLibrary, generate_library
+from zotero_tui.database.connection import ZoteroDB
+from zotero_tui.database.duplicates import DuplicateGroup, find_duplicates
+from zotero_tui.database.models import ZoteroItem
+from zotero_tui.database.queries import fetch_all_items
+
+DEDUP_ITEMS = int(os.environ.get("ZOTERO_TUI_BENCH_DEDUP_ITEMS", "50000"))
+DUPLICATE_RATIO = 0.05
+BUDGET_SECONDS = 10.0
+MIN_RECALL = 0.95
+
+
+@pytest.fixture(scope="module")
+def dedup_library(tmp_path_factory: pytest.TempPathFactory) -> SyntheticLibrary:
+  spec = LibrarySpec(
+    items=DEDUP_ITEMS, attachments_per_item=0, duplicate_ratio=DUPLICATE_RATIO
+  )
+  return generate_library(tmp_path_factory.mktemp("dedup") / "zotero.sqlite", spec)
+
+
+@pytest.fixture(scope="module")
+def large_items(dedup_library: SyntheticLibrary) -> list[ZoteroItem]:
+  with ZoteroDB(dedup_library.path).connect() as conn:
+    return list(fetch_all_items(conn))
+
+
+def recall(
+  groups: list[DuplicateGroup],
+  items: list[ZoteroItem],
+  planted: list[tuple[int, int]],
+) -> float:
+  """Share of planted pairs (both items loaded) that share a group."""
+  group_of = {item.item_id: n for n, group in enumerate(groups) for item in group.items}
+  loaded = {item.item_id for item in items}
+  pairs = [(a, b) for a, b in planted if a in loaded and b in loaded]
+  found = sum(a in group_of and group_of.get(a) == group_of.get(b) for a, b in pairs)
+  return found / len(pairs)
+
+
+def test_find_duplicates(
+  benchmark, dedup_library: SyntheticLibrary, large_items: list[ZoteroItem]
+):
+  groups = benchmark.pedantic(find_duplicates, args=(large_items,), rounds=3)
+
+  # No stats are collected under --benchmark-disable
+  if benchmark.stats is not None:
+    assert benchmark.stats.stats.max < BUDGET_SECONDS
+  assert recall(groups, large_items, dedup_library.duplicates) >= MIN_RECALL
+
+
+def test_parallel_matches_serial(
+  monkeypatch: pytest.MonkeyPatch, large_items: list[ZoteroItem]
+):
+  from zotero_tui.database import duplicates
+
+  serial = find_duplicates(large_items, max_workers=1)
+  monkeypatch.setattr(duplicates, "PARALLEL_MIN_PAIRS", 0)
+  parallel = find_duplicates(large_items, max_workers=2)
+
+  def summary(groups: list[DuplicateGroup]) -> list[tuple]:
+    return [([item.item_id for item in g.items], g.score, g.reason) for g in groups]
+
+  assert summary(parallel) == summary(serial)
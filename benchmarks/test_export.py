@@ -0,0 +1,64 @@
+import re
+
+from zotero_tui.database.models import (
+  Author,
+  UnsupportedItemTypeError,
+  ZoteroItem,
+  items_to_bibtex,
+)
+
+
+def test_to_bibtex(benchmark, items: list[ZoteroItem]):
+  sample = items[:1000]
+
+  def export() -> int:
+    exported = 0
+    for item in sample:
+      try:
+        item.to_bibtex()
+        exported += 1
+      except UnsupportedItemTypeError:
+        pass
+    return exported
+
+  assert benchmark.pedantic(export, rounds=3, iterations=1) > 0
+
+
+def test_items_to_bibtex_selection(benchmark, items: list[ZoteroItem]):
+  """Yank of a 500-item selection: one render, as done for multi-select."""
+  selection = items[:500]
+
+  text, skipped = benchmark.pedantic(items_to_bibtex, args=(selection,), rounds=5)
+
+  # Entries follow the selection; repeated keys only gain a suffix
+  exported = [item for item in selection if item not in skipped]
+  keys = re.findall(r"^@\w+\{(\w+),", text, flags=re.MULTILINE)
+  assert len(keys) == len(exported)
+  assert len(set(keys)) == len(keys)
+  for key, item in zip(keys, exported):
+    assert key.startswith(item.to_bibtex_entry()["ID"])
+
+
+def test_items_to_bibtex_keeps_selection_order():
+  def article(item_id: int, last_name: str, year: int) -> ZoteroItem:
+    return ZoteroItem(
+      item_id=item_id,
+      key=f"KEY{item_id:05d}",
+      item_type="journalArticle",
+      title=f"Paper {item_id}",
+      authors=[Author(last_name=last_name, first_name="Ada")],
+      year=year,
+    )
+
+  selection = [
+    article(1, "Rodriguez", 2016),
+    article(2, "Smith", 2020),
+    article(3, "Li", 1995),
+    article(4, "Smith", 2020),
+    article(5, "Garcia", 2012),
+  ]
+  text, skipped = items_to_bibtex(selection)
+
+  keys = re.findall(r"^@\w+\{(\w+),", text, flags=re.MULTILINE)
+  assert keys == ["rodriguez2016", "smith2020", "li1995", "smith2020a", "garcia2012"]
+  assert skipped == []
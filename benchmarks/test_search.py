@@ -0,0 +1,62 @@
+from datetime import date
+
+from zotero_tui.database.models import ZoteroItem
+from zotero_tui.database.search import RankedResults, relevance
+from zotero_tui.ui.events import SearchChanged
+
+QUERIES = ["attention", "smith", "2019", "bayesian infrence", "zzzz"]
+TYPED_QUERY = "stochastic gradient"
+
+
+def test_is_query_match(benchmark, items: list[ZoteroItem]):
+  def match_all() -> int:
+    return sum(item.is_query_match(q) for q in QUERIES for item in items)
+
+  benchmark.pedantic(match_all, rounds=3, iterations=1)
+
+
+def test_search_typing_replay(benchmark, run_in_app):
+  """Types a query one key at a time, filtering the table on every key."""
+  prefixes = [TYPED_QUERY[: i + 1] for i in range(len(TYPED_QUERY))]
+
+  def body(app) -> None:
+    def replay() -> None:
+      for prefix in prefixes:
+        app.on_search_changed(SearchChanged(prefix))
+      app.on_search_changed(SearchChanged(""))
+
+    benchmark.pedantic(replay, rounds=3, iterations=1)
+
+  run_in_app(body)
+
+
+def test_ranked_top_k(benchmark, items: list[ZoteroItem]):
+  """Scores every item and selects the first screenful of ranked results."""
+
+  def rank_all() -> int:
+    return sum(len(RankedResults(items, q).top(100)) for q in QUERIES)
+
+  benchmark.pedantic(rank_all, rounds=3, iterations=1)
+
+
+def test_ranked_results_order(items: list[ZoteroItem]):
+  """`top` then `stream` yield every match once, best first."""
+  current_year = date.today().year
+  streamed = False
+  for query in QUERIES:
+    ranked = RankedResults(items, query)
+    results = ranked.top(100)
+    for batch in ranked.stream(500):
+      results.extend(batch)
+      streamed = True
+
+    ids = [item.item_id for item in results]
+    assert len(ids) == len(set(ids)) == len(ranked)
+    assert set(ids) == {item.item_id for item in items if item.is_query_match(query)}
+
+    scores = [
+      relevance(item, item.query_scores(query), current_year) for item in results
+    ]
+    assert all(a >= b for a, b in zip(scores, scores[1:]))
+
+  assert streamed, "No query had more matches than the first page"
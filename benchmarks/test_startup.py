@@ -0,0 +1,70 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+LAZY_MODULES = ["textual", "bibtexparser", "pyperclip", "rapidfuzz"]
+# Loaded by the app only when the feature is used
+ON_DEMAND_MODULES = ["multiprocessing", "zotero_tui.database.duplicates"]
+
+FIRST_PAINT_SCRIPT = """
+import asyncio, sys
+from pathlib import Path
+from zotero_tui.database.connection import ZoteroDB
+from zotero_tui.ui.app import ZoteroApp
+
+async def main():
+  app = ZoteroApp(db=ZoteroDB(Path(sys.argv[1])))
+  async with app.run_test() as pilot:
+    await pilot.pause()
+
+asyncio.run(main())
+"""
+
+
+def _python(*args: str) -> subprocess.CompletedProcess[str]:
+  return subprocess.run(
+    [sys.executable, *args], capture_output=True, text=True, check=True
+  )
+
+
+def _import_time_us(module: str) -> int:
+  """Cumulative `-X importtime` cost of `module` in a fresh interpreter."""
+  stderr = _python("-X", "importtime", "-c", f"import {module}").stderr
+  for line in stderr.splitlines():
+    parts = [p.strip() for p in line.split("|")]
+    if len(parts) == 3 and parts[2] == module:
+      return int(parts[1])
+
+  raise AssertionError(f"{module} not found in importtime output")
+
+
+def _loaded_after_import(module: str, candidates: list[str]) -> str:
+  check = (
+    f"import sys, {module}; "
+    f"print(','.join(m for m in {candidates!r} if m in sys.modules))"
+  )
+  return _python("-c", check).stdout.strip()
+
+
+@pytest.mark.parametrize("module", ["zotero_tui.main", "zotero_tui.database.queries"])
+def test_core_imports_skip_heavy_dependencies(module: str):
+  assert _loaded_after_import(module, LAZY_MODULES) == ""
+
+
+def test_app_import_skips_on_demand_features():
+  assert _loaded_after_import("zotero_tui.ui.app", ON_DEMAND_MODULES) == ""
+
+
+@pytest.mark.parametrize("module", ["zotero_tui.main", "zotero_tui.ui.app"])
+def test_import_time(benchmark, module: str):
+  benchmark.extra_info["importtime_us"] = _import_time_us(module)
+  benchmark.pedantic(_python, args=("-c", f"import {module}"), rounds=5, iterations=1)
+
+
+def test_time_to_first_paint(benchmark, library_db: Path):
+  """Fresh interpreter: imports, DB load and the first rendered frame."""
+  benchmark.pedantic(
+    _python, args=("-c", FIRST_PAINT_SCRIPT, str(library_db)), rounds=3, iterations=1
+  )
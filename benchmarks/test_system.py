@@ -0,0 +1,38 @@
+import time
+from pathlib import Path
+
+import pytest
+
+from zotero_tui.utils import system
+from zotero_tui.utils.system import ProcessLauncher
+
+INTERVAL = 0.05
+
+
+@pytest.fixture
+def launches(monkeypatch: pytest.MonkeyPatch) -> list[float]:
+  """Records launch times instead of starting openers."""
+  times: list[float] = []
+  monkeypatch.setattr(system, "open_file", lambda *_: times.append(time.monotonic()))
+  return times
+
+
+def test_launcher_staggers_launches(launches: list[float]):
+  launcher = ProcessLauncher(interval=INTERVAL)
+  launcher.open([Path(f"/tmp/{n}.pdf") for n in range(4)])
+  launcher._executor.shutdown(wait=True)
+
+  assert len(launches) == 4
+  assert all(b - a >= INTERVAL for a, b in zip(launches, launches[1:]))
+
+
+def test_launcher_shutdown_drops_pending_launches(launches: list[float]):
+  launcher = ProcessLauncher(interval=10)
+  launcher.open([Path("/tmp/a.pdf"), Path("/tmp/b.pdf")])
+
+  start = time.monotonic()
+  launcher.shutdown()
+  launcher._executor.shutdown(wait=True)
+
+  assert len(launches) == 1
+  assert time.monotonic() - start < 1
@@ -0,0 +1,16 @@
+from zotero_tui.ui.widget.item_table import SORT_ORDERS, ZoteroTable
+
+
+def test_sort_cycling(benchmark, run_in_app):
+  """Rebuilds the table once per sort order."""
+
+  def body(app) -> None:
+    table = app.query_one(ZoteroTable)
+
+    def cycle_all() -> None:
+      for sort_order in SORT_ORDERS:
+        table.apply_filter("", sort_order)
+
+    benchmark.pedantic(cycle_all, rounds=3, iterations=1)
+
+  run_in_app(body)
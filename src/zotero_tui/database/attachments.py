@@ -0,0 +1,193 @@
+import json
+import os
+import platform
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from enum import Enum
+from pathlib import Path
+from typing import Callable, Iterable
+
+from zotero_tui.database.models import Attachment, ZoteroItem
+
+
+STORAGE_DIR_ENV = "ZOTERO_TUI_STORAGE_DIR"
+BASE_DIR_ENV = "ZOTERO_TUI_BASE_DIR"
+
+BASE_DIR_PREF = "extensions.zotero.baseAttachmentPath"
+PREF_PATTERN = re.compile(r'^user_pref\("([^"]+)",\s*(.+)\);\s*$')
+
+
+def find_prefs_files() -> list[Path]:
+  """Lists Zotero `prefs.js` files in the standard profile locations."""
+  system = platform.system()
+  if system == "Darwin":
+    profiles = Path("~/Library/Application Support/Zotero/Profiles")
+  elif system == "Windows":
+    profiles = Path(os.environ.get("APPDATA", "~")) / "Zotero" / "Zotero" / "Profiles"
+  else:
+    profiles = Path("~/.zotero/zotero")
+
+  return sorted(profiles.expanduser().glob("*/prefs.js"))
+
+
+def read_zotero_prefs(prefs_path: Path) -> dict[str, str | int | bool]:
+  """Parses the `user_pref(...)` lines of a Zotero `prefs.js` file."""
+  prefs: dict[str, str | int | bool] = {}
+  try:
+    lines = prefs_path.read_text(encoding="utf-8").splitlines()
+  except OSError:
+    return prefs
+
+  for line in lines:
+    match = PREF_PATTERN.match(line)
+    if match is None:
+      continue
+
+    try:
+      prefs[match.group(1)] = json.loads(match.group(2))
+    except json.JSONDecodeError:
+      continue
+
+  return prefs
+
+
+@dataclass(frozen=True)
+class AttachmentResolver:
+  """Turns DB attachment paths into absolute filesystem paths."""
+
+  storage_base: Path
+  linked_base: Path | None = None
+
+  @classmethod
+  def from_config(cls, data_dir: Path) -> "AttachmentResolver":
+    """
+    Env vars win, then Zotero prefs, then the defaults of the data dir.
+    """
+    storage_base = Path(
+      os.environ.get(STORAGE_DIR_ENV) or data_dir.expanduser() / "storage"
+    )
+
+    linked_base = os.environ.get(BASE_DIR_ENV)
+    if not linked_base:
+      for prefs_path in find_prefs_files():
+        pref = read_zotero_prefs(prefs_path).get(BASE_DIR_PREF)
+        if isinstance(pref, str) and pref:
+          linked_base = pref
+          break
+
+    return cls(
+      storage_base=storage_base.expanduser(),
+      linked_base=Path(linked_base).expanduser() if linked_base else None,
+    )
+
+  def resolve(self, attachment: Attachment) -> Path:
+    return attachment.get_absolute_path(self.storage_base, self.linked_base)
+
+
+@dataclass(frozen=True)
+class FileStatus:
+  path: Path
+  exists: bool
+  size: int | None = None
+
+  @classmethod
+  def check(cls, path: Path) -> "FileStatus":
+    try:
+      stat = path.stat()
+    except OSError:
+      return cls(path=path, exists=False)
+
+    return cls(path=path, exists=True, size=stat.st_size)
+
+
+class AttachmentState(Enum):
+  """PDF availability of an item; other attachment types are ignored."""
+
+  NONE = "none"  # Item has no PDF attachments
+  PENDING = "pending"  # Not checked yet
+  PRESENT = "present"  # At least one PDF exists on disk
+  MISSING = "missing"  # PDFs are listed, but none exist
+
+
+class AttachmentIndex:
+  """
+  Caches resolved attachment paths and checks them on a background pool.
+  Lookups never touch the filesystem, so they are safe on the UI thread.
+  """
+
+  MAX_WORKERS = 8
+  BATCH_SIZE = 64
+
+  def __init__(self, resolver: AttachmentResolver, max_workers: int = MAX_WORKERS):
+    self.resolver = resolver
+    self._paths: dict[Attachment, Path] = {}
+    self._status: dict[Path, FileStatus] = {}
+    self._lock = threading.Lock()
+    self._executor = ThreadPoolExecutor(
+      max_workers=max_workers, thread_name_prefix="zotero-attachments"
+    )
+
+  def path_for(self, attachment: Attachment) -> Path:
+    """Resolved absolute path (pure string work, cached)."""
+    path = self._paths.get(attachment)
+    if path is None:
+      path = self.resolver.resolve(attachment)
+      self._paths[attachment] = path
+
+    return path
+
+  def status(self, attachment: Attachment) -> FileStatus | None:
+    """Cached status, or None when the check has not finished yet."""
+    return self._status.get(self.path_for(attachment))
+
+  def item_state(self, item: ZoteroItem) -> AttachmentState:
+    pdfs = [att for att in item.attachments if att.is_pdf]
+    if not pdfs:
+      return AttachmentState.NONE
+
+    statuses = [self.status(att) for att in pdfs]
+    if any(s is not None and s.exists for s in statuses):
+      return AttachmentState.PRESENT
+    if any(s is None for s in statuses):
+      return AttachmentState.PENDING
+
+    return AttachmentState.MISSING
+
+  def refresh(
+    self, items: Iterable[ZoteroItem], on_done: Callable[[], None] | None = None
+  ) -> None:
+    """
+    Resolves every attachment path now and re-checks them in the background.
+    Old results are kept until replaced. `on_done` runs on a worker thread.
+    """
+    paths = list(
+      dict.fromkeys(self.path_for(att) for item in items for att in item.attachments)
+    )
+    batches = [
+      paths[i : i + self.BATCH_SIZE] for i in range(0, len(paths), self.BATCH_SIZE)
+    ]
+    if not batches:
+      if on_done:
+        self._executor.submit(on_done)
+      return
+
+    remaining = len(batches)
+
+    def check_batch(batch: list[Path]) -> None:
+      nonlocal remaining
+      results = {path: FileStatus.check(path) for path in batch}
+      with self._lock:
+        self._status.update(results)
+        remaining -= 1
+        finished = remaining == 0
+
+      if finished and on_done:
+        on_done()
+
+    for batch in batches:
+      self._executor.submit(check_batch, batch)
+
+  def shutdown(self) -> None:
+    self._executor.shutdown(wait=False, cancel_futures=True)
@@ -10,6 +10,11 @@ class ZoteroDB:
     self._watcher_conn: sqlite3.Connection | None = None
     self._last_version: int | None = None
 
+  @property
+  def data_dir(self) -> Path:
+    """The Zotero data directory (holds `zotero.sqlite` and `storage/`)."""
+    return self.db_path.parent
+
   @contextmanager
   def connect(self) -> Generator[sqlite3.Connection, None, None]:
     conn = sqlite3.connect(f"file:{self.db_path}?mode=ro&nolock=1", uri=True)
@@ -0,0 +1,216 @@
+import multiprocessing
+import os
+import random
+import re
+import zlib
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, NamedTuple
+
+from zotero_tui.database.models import ZoteroItem
+from zotero_tui.utils.profiling import PROFILER
+
+
+TITLE_THRESHOLD = 90  # token_sort_ratio needed for a title-only match
+YEAR_TOLERANCE = 1  # Preprint and published versions often differ by a year
+
+# MinHash LSH: titles sharing all rows of any band become candidates
+NUM_BANDS = 4
+ROWS_PER_BAND = 4
+MAX_BLOCK_SIZE = 200  # Larger blocks are too generic to be informative
+
+# Scoring takes ~2 µs per pair and a worker pool ~0.2 s to start, so the
+# pool only pays off for very large candidate sets
+PARALLEL_MIN_PAIRS = 100_000
+CHUNK_SIZE = 5_000
+
+STOPWORDS = frozenset(
+  "a an and are as at by for from in into is of on or the to via with".split()
+)
+TOKEN_PATTERN = re.compile(r"\w+")
+DOI_PREFIX = re.compile(r"^(https?://(dx\.)?doi\.org/|doi:)")
+
+_MERSENNE_PRIME = (1 << 61) - 1
+_rng = random.Random(0)
+_PERMUTATIONS = [
+  (_rng.randrange(1, _MERSENNE_PRIME), _rng.randrange(0, _MERSENNE_PRIME))
+  for _ in range(NUM_BANDS * ROWS_PER_BAND)
+]
+
+
+class DuplicateGroup(NamedTuple):
+  items: list[ZoteroItem]
+  score: float  # Lowest pair score in the group (100 for DOI matches)
+  reason: str  # "DOI" or "title"
+
+
+def normalize_doi(doi: str | None) -> str | None:
+  if not doi:
+    return None
+  return DOI_PREFIX.sub("", doi.strip().lower()) or None
+
+
+def title_tokens(title: str) -> list[str]:
+  """Lower-cased title words without punctuation or stopwords."""
+  return [t for t in TOKEN_PATTERN.findall(title.lower()) if t not in STOPWORDS]
+
+
+def _token_hashes(token: str) -> tuple[int, ...]:
+  h = zlib.crc32(token.encode())
+  return tuple((a * h + b) % _MERSENNE_PRIME for a, b in _PERMUTATIONS)
+
+
+def minhash_bands(
+  tokens: Iterable[str], cache: dict[str, tuple[int, ...]] | None = None
+) -> list[tuple[int, ...]]:
+  """
+  LSH band keys of a token set's MinHash signature. Titles share most of
+  their vocabulary, so per-token hashes can be memoised in `cache`.
+  """
+  cache = {} if cache is None else cache
+  token_hashes = []
+  for token in set(tokens):
+    hashes = cache.get(token)
+    if hashes is None:
+      hashes = cache[token] = _token_hashes(token)
+    token_hashes.append(hashes)
+
+  if not token_hashes:
+    return []
+
+  if len(token_hashes) > 1:
+    signature = list(map(min, *token_hashes))
+  else:
+    signature = list(token_hashes[0])
+  return [
+    tuple(signature[i : i + ROWS_PER_BAND])
+    for i in range(0, len(signature), ROWS_PER_BAND)
+  ]
+
+
+def _score_pairs(
+  pairs: list[tuple[int, int, str, str]],
+) -> list[tuple[int, int, float]]:
+  """Fuzzy title scores for candidate pairs, keeping only matches."""
+  from rapidfuzz import fuzz
+
+  matches = []
+  for i, j, title_i, title_j in pairs:
+    score = fuzz.token_sort_ratio(title_i, title_j, score_cutoff=TITLE_THRESHOLD)
+    if score:
+      matches.append((i, j, score))
+  return matches
+
+
+def _process_context() -> multiprocessing.context.BaseContext:
+  """
+  Start method for the scoring pool. The pool is started from a worker
+  thread of the app, and forking a threaded process can deadlock.
+  """
+  if "forkserver" in multiprocessing.get_all_start_methods():
+    return multiprocessing.get_context("forkserver")
+  return multiprocessing.get_context("spawn")
+
+
+def _author_names(item: ZoteroItem) -> frozenset[str]:
+  return frozenset(author.last_name.lower() for author in item.authors)
+
+
+def find_duplicates(
+  items: list[ZoteroItem], max_workers: int | None = None
+) -> list[DuplicateGroup]:
+  """
+  Groups likely duplicates. Candidates are blocked by DOI and by title
+  MinHash, so rapidfuzz only runs inside blocks. Title candidates must be
+  within the year tolerance and share an author surname, unless either
+  side has no authors (author order and spelling of first names vary
+  between sources, so only surnames are compared).
+  """
+  doi_pairs: set[tuple[int, int]] = set()
+  title_pairs: set[tuple[int, int]] = set()
+
+  with PROFILER.span("dedup.block"):
+    titles = [" ".join(title_tokens(item.title)) for item in items]
+    years = [item.year for item in items]
+    authors = [_author_names(item) for item in items]
+
+    by_doi: dict[str, list[int]] = defaultdict(list)
+    by_band: dict[tuple, list[int]] = defaultdict(list)
+    hash_cache: dict[str, tuple[int, ...]] = {}
+    for idx, item in enumerate(items):
+      doi = normalize_doi(item.doi)
+      if doi:
+        by_doi[doi].append(idx)
+
+      bands = minhash_bands(titles[idx].split(), hash_cache)
+      for band_idx, band in enumerate(bands):
+        by_band[(band_idx, band)].append(idx)
+
+    for block in by_doi.values():
+      doi_pairs.update(
+        (i, j) for n, i in enumerate(block) for j in block[n + 1 :]
+      )
+
+    for block in by_band.values():
+      if not 1 < len(block) <= MAX_BLOCK_SIZE:
+        continue
+
+      for n, i in enumerate(block):
+        for j in block[n + 1 :]:
+          undated = years[i] <= 0 or years[j] <= 0
+          if not undated and abs(years[i] - years[j]) > YEAR_TOLERANCE:
+            continue
+          if authors[i] and authors[j] and authors[i].isdisjoint(authors[j]):
+            continue
+          title_pairs.add((i, j))
+
+    title_pairs -= doi_pairs
+
+  with PROFILER.span("dedup.score"):
+    candidates = [(i, j, titles[i], titles[j]) for i, j in title_pairs]
+    chunks = [
+      candidates[n : n + CHUNK_SIZE] for n in range(0, len(candidates), CHUNK_SIZE)
+    ]
+    workers = max_workers if max_workers is not None else os.cpu_count() or 1
+    if workers > 1 and len(candidates) >= PARALLEL_MIN_PAIRS:
+      with ProcessPoolExecutor(workers, mp_context=_process_context()) as pool:
+        results = list(pool.map(_score_pairs, chunks))
+    else:
+      results = [_score_pairs(chunk) for chunk in chunks]
+    scored = [match for result in results for match in result]
+
+  # Union-find over matched pairs
+  parent = list(range(len(items)))
+
+  def find(i: int) -> int:
+    while parent[i] != i:
+      parent[i] = parent[parent[i]]
+      i = parent[i]
+    return i
+
+  edges = [(i, j, 100.0, "DOI") for i, j in doi_pairs]
+  edges += [(i, j, score, "title") for i, j, score in scored]
+  group_score: dict[int, float] = {}
+  group_reason: dict[int, str] = {}
+  for i, j, score, reason in edges:
+    root_i, root_j = find(i), find(j)
+    if root_i != root_j:
+      parent[root_j] = root_i
+
+  for i, j, score, reason in edges:
+    root = find(i)
+    group_score[root] = min(score, group_score.get(root, 100.0))
+    if group_reason.get(root) != "DOI":
+      group_reason[root] = reason
+
+  members: dict[int, list[ZoteroItem]] = defaultdict(list)
+  for idx in range(len(items)):
+    root = find(idx)
+    if root in group_reason:
+      members[root].append(items[idx])
+
+  groups = [
+    DuplicateGroup(group, group_score[root], group_reason[root])
+    for root, group in members.items()
+  ]
+  return sorted(groups, key=lambda g: (-g.score, g.items[0].title.lower()))
@@ -1,32 +1,65 @@
-import bibtexparser
-
+from functools import cache
 from pathlib import Path
 from dataclasses import dataclass, field
-
-from rapidfuzz import fuzz
-from bibtexparser.bibdatabase import BibDatabase
+from typing import Iterable, NamedTuple
 
 
 FUZZY_THRESHOLD = 70
 
 
+@cache
+def _fuzz():
+  """`rapidfuzz.fuzz`, imported once on first use to keep startup light."""
+  from rapidfuzz import fuzz
+
+  return fuzz
+
+
 class UnsupportedItemTypeError(Exception):
   """Raised when an item type is not yet mapped for BibTeX."""
 
   pass
 
 
+class MatchScores(NamedTuple):
+  """Fuzzy scores (0-100) of a query against an item's fields."""
+
+  title: float
+  author: float
+  venue: float
+  year: bool  # Year appears in the query
+
+  @property
+  def is_match(self) -> bool:
+    """Same rule as `ZoteroItem.is_query_match` (venue only affects ranking)."""
+    return (
+      self.year or self.title >= FUZZY_THRESHOLD or self.author >= FUZZY_THRESHOLD
+    )
+
+
 @dataclass(frozen=True)
 class Attachment:
   path: Path
   item_key: str  # The 8-char folder name (e.g., 'A8JX7B2A')
   is_link: bool
+  content_type: str | None = None  # MIME type, e.g. 'application/pdf'
 
-  def get_absolute_path(self, storage_base: Path) -> Path:
+  @property
+  def is_pdf(self) -> bool:
+    return self.content_type == "application/pdf"
+
+  def get_absolute_path(
+    self, storage_base: Path, linked_base: Path | None = None
+  ) -> Path:
     if not self.is_link:
       # Stored files look like 'storage:paper.pdf' in DB
       clean_name = str(self.path).replace("storage:", "")
       return storage_base / self.item_key / clean_name
+
+    # Links relative to the base directory look like 'attachments:dir/paper.pdf'
+    raw_path = str(self.path)
+    if linked_base is not None and raw_path.startswith("attachments:"):
+      return linked_base / raw_path.replace("attachments:", "", 1)
     return self.path
 
 
@@ -91,6 +124,7 @@ class ZoteroItem:
     if not query:
       return True
 
+    fuzz = _fuzz()
     query = query.lower()
 
     # Check year
@@ -109,7 +143,28 @@ class ZoteroItem:
 
     return False
 
+  def query_scores(self, query: str) -> MatchScores:
+    """Like `is_query_match`, but keeps every score for ranking."""
+    fuzz = _fuzz()
+    query = query.lower()
+    return MatchScores(
+      title=fuzz.partial_ratio(query, self.title.lower()),
+      author=fuzz.partial_ratio(query, self.author_full(sep_str=" ")),
+      venue=fuzz.partial_ratio(query, self.venue.lower()) if self.venue else 0.0,
+      year=str(self.year) in query,
+    )
+
   def to_bibtex(self) -> str:
+    # Imported lazily: only needed when yanking
+    import bibtexparser
+    from bibtexparser.bibdatabase import BibDatabase
+
+    db = BibDatabase()
+    db.entries = [self.to_bibtex_entry()]
+    return bibtexparser.dumps(db).strip()
+
+  def to_bibtex_entry(self) -> dict[str, str]:
+    """The bibtexparser entry dict for this item."""
     # Strict mapping requirement
     type_map = {
       "conferencePaper": "inproceedings",
@@ -122,8 +177,6 @@ class ZoteroItem:
     if self.item_type not in type_map:
       raise UnsupportedItemTypeError(f"Type '{self.item_type}' not supported yet.")
 
-    # Construct BibDatabase object
-    db = BibDatabase()
     author_last = (
       self.authors[0].last_name.lower().replace(" ", "") if self.authors else "anon"
     )
@@ -152,5 +205,50 @@ class ZoteroItem:
     if self.publisher:
       entry["publisher"] = self.publisher
 
-    db.entries = [entry]
-    return bibtexparser.dumps(db).strip()
+    return entry
+
+
+def _key_suffix(n: int) -> str:
+  """1 -> 'a', 26 -> 'z', 27 -> 'aa', ..."""
+  suffix = ""
+  while n:
+    n, rem = divmod(n - 1, 26)
+    suffix = chr(ord("a") + rem) + suffix
+  return suffix
+
+
+def items_to_bibtex(items: Iterable[ZoteroItem]) -> tuple[str, list[ZoteroItem]]:
+  """
+  Renders many items as one BibTeX string in a single pass.
+  Returns the text and the items skipped for unsupported types.
+  """
+  from bibtexparser.bibdatabase import BibDatabase
+  from bibtexparser.bwriter import BibTexWriter
+
+  entries = []
+  skipped = []
+  seen_ids: dict[str, int] = {}
+  for item in items:
+    try:
+      entry = item.to_bibtex_entry()
+    except UnsupportedItemTypeError:
+      skipped.append(item)
+      continue
+
+    # Disambiguate repeated keys: smith2020, smith2020a, smith2020b, ...
+    base_id = entry["ID"]
+    count = seen_ids.get(base_id, 0)
+    seen_ids[base_id] = count + 1
+    if count:
+      entry["ID"] = f"{base_id}{_key_suffix(count)}"
+    entries.append(entry)
+
+  if not entries:
+    return "", skipped
+
+  db = BibDatabase()
+  db.entries = entries
+  # The default writer sorts by key; keep the order of the selection
+  writer = BibTexWriter()
+  writer.order_entries_by = None
+  return writer.write(db).strip(), skipped
@@ -1,9 +1,11 @@
 import sqlite3
+import time
 from collections import defaultdict
 from pathlib import Path
 from typing import NamedTuple
 
 from zotero_tui.database.models import Attachment, Author, ZoteroItem
+from zotero_tui.utils.profiling import PROFILER
 
 
 class EntryKey(NamedTuple):
@@ -32,7 +34,7 @@ def fetch_attachments_for_item(
 ) -> list[Attachment]:
   """Retrieves all file attachments linked to a parent item."""
   query = """
-    SELECT path, key 
+    SELECT path, key, contentType
     FROM itemAttachments 
     JOIN items USING (itemID) 
     WHERE parentItemID = ?
@@ -43,7 +45,10 @@ def fetch_attachments_for_item(
       p = Path(row["path"])
       attachments.append(
         Attachment(
-          path=p, item_key=row["key"], is_link=not str(p).startswith("storage:")
+          path=p,
+          item_key=row["key"],
+          is_link=not str(p).startswith("storage:"),
+          content_type=row["contentType"],
         )
       )
   return attachments
@@ -104,20 +109,29 @@ def fetch_all_items(conn: sqlite3.Connection):
         28  -- Note
       )
   """
+  # One span: splitting load from pivot would mean holding every row at once
   data: dict[EntryKey, dict[str, str]] = defaultdict(dict)
-  for row in conn.execute(query):
-    key = EntryKey(row["itemID"], row["key"], row["typeName"])
-    field = row["fieldName"]
-    value = row["value"]
+  with PROFILER.span("db.load"):
+    for row in conn.execute(query):
+      key = EntryKey(row["itemID"], row["key"], row["typeName"])
+      field = row["fieldName"]
+      value = row["value"]
 
-    if field in ignore_fields:
-      continue
+      if field in ignore_fields:
+        continue
 
-    data[key][field] = value
+      data[key][field] = value
 
+  # Per-item lookups are summed into one span rather than flooding the buffer
+  related_time = 0.0
   for key, meta in data.items():
     year = int(meta["date"][:4]) if "date" in meta else -1  # default for missing
 
+    start = time.perf_counter()
+    authors = fetch_authors_for_item(conn, key.item_id)
+    attachments = fetch_attachments_for_item(conn, key.item_id)
+    related_time += time.perf_counter() - start
+
     yield ZoteroItem(
       # Keys
       item_id=key.item_id,
@@ -125,10 +139,10 @@ def fetch_all_items(conn: sqlite3.Connection):
       item_type=key.item_type,
       # Main fields
       title=meta["title"],
-      authors=fetch_authors_for_item(conn, key.item_id),
+      authors=authors,
       year=year or 0,
       abstract=meta.get("abstractNote"),
-      attachments=fetch_attachments_for_item(conn, key.item_id),
+      attachments=attachments,
       # Meta
       venue=get_venue_str(meta),
       volume=meta.get("volume"),
@@ -137,3 +151,5 @@ def fetch_all_items(conn: sqlite3.Connection):
       doi=meta.get("DOI"),
       publisher=meta.get("publisher"),
     )
+
+  PROFILER.record("db.related", related_time)
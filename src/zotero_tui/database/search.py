@@ -0,0 +1,77 @@
+import heapq
+from datetime import date
+from typing import Iterable, Iterator
+
+from zotero_tui.database.models import MatchScores, ZoteroItem
+
+
+# Relevance = weighted fuzzy scores + bonuses (roughly on a 0-100 scale)
+TITLE_WEIGHT = 0.6
+AUTHOR_WEIGHT = 0.3
+VENUE_WEIGHT = 0.1
+YEAR_MATCH_BONUS = 20.0
+RECENCY_BONUS = 10.0  # Bonus for an item from this year
+RECENCY_HALF_LIFE = 5.0  # Years until the recency bonus halves
+
+
+def relevance(
+  item: ZoteroItem, scores: MatchScores, current_year: int | None = None
+) -> float:
+  """Combines the field scores of an item with a recency boost."""
+  current_year = current_year or date.today().year
+  score = (
+    TITLE_WEIGHT * scores.title
+    + AUTHOR_WEIGHT * scores.author
+    + VENUE_WEIGHT * scores.venue
+  )
+  if scores.year:
+    score += YEAR_MATCH_BONUS
+  if item.year > 0:
+    age = max(0, current_year - item.year)
+    score += RECENCY_BONUS * 0.5 ** (age / RECENCY_HALF_LIFE)
+
+  return score
+
+
+class RankedResults:
+  """
+  Matches of a query, handed out best first.
+
+  `top` selects the first K with a bounded heap; `stream` pops the rest off
+  a heap in batches. The full match set is never sorted in one go.
+  """
+
+  def __init__(self, items: Iterable[ZoteroItem], query: str) -> None:
+    current_year = date.today().year
+    # (score, -item_id, item): ties go to the lower item id
+    self._entries: list[tuple[float, int, ZoteroItem]] = []
+    for item in items:
+      scores = item.query_scores(query)
+      if scores.is_match:
+        score = relevance(item, scores, current_year)
+        self._entries.append((score, -item.item_id, item))
+
+    self._taken: set[int] = set()
+
+  def __len__(self) -> int:
+    return len(self._entries)
+
+  def top(self, k: int) -> list[ZoteroItem]:
+    """The best `k` matches, best first."""
+    best = heapq.nlargest(k, self._entries, key=lambda entry: entry[:2])
+    self._taken = {item.item_id for *_, item in best}
+    return [item for *_, item in best]
+
+  def stream(self, batch_size: int) -> Iterator[list[ZoteroItem]]:
+    """The matches not returned by `top`, best first, in batches."""
+    # Negated scores turn heapq's min-heap into a max-heap
+    heap = [
+      (-score, -neg_id, item)
+      for score, neg_id, item in self._entries
+      if item.item_id not in self._taken
+    ]
+    heapq.heapify(heap)
+
+    while heap:
+      n = min(batch_size, len(heap))
+      yield [heapq.heappop(heap)[2] for _ in range(n)]
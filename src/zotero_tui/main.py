@@ -1,15 +1,30 @@
+import cProfile
 from pathlib import Path
 
 from zotero_tui.database.connection import ZoteroDB
-from zotero_tui.ui.app import ZoteroApp
+from zotero_tui.utils.profiling import PROFILER, profile_mode, profile_out_path
 
 
 def run_app():
   p = Path("~/Zotero/zotero.sqlite")
   db = ZoteroDB(p)
 
+  # Imported here so the UI stack (Textual) only loads when the app runs
+  from zotero_tui.ui.app import ZoteroApp
+
   app = ZoteroApp(db=db)
-  app.run()
+
+  # ZOTERO_TUI_PROFILE=spans|cprofile (output: ZOTERO_TUI_PROFILE_OUT)
+  mode = profile_mode()
+  if mode == "cprofile":
+    profiler = cProfile.Profile()
+    profiler.runcall(app.run)
+    profiler.dump_stats(profile_out_path(mode))
+  else:
+    app.run()
+
+  if mode == "spans":
+    PROFILER.dump_json(profile_out_path(mode))
 
 
 if __name__ == "__main__":
@@ -1,25 +1,34 @@
 from pathlib import Path
+from typing import TYPE_CHECKING
 
-import pyperclip
+from textual import work
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal
 from textual.widgets import DataTable, Footer, Input, Static
+from textual.widgets.data_table import RowDoesNotExist
 
+from zotero_tui.database.attachments import AttachmentIndex, AttachmentResolver
 from zotero_tui.database.connection import ZoteroDB
-from zotero_tui.database.models import Attachment, ZoteroItem
+from zotero_tui.database.models import Attachment, ZoteroItem, items_to_bibtex
 from zotero_tui.database.queries import fetch_all_items
-from zotero_tui.ui.events import SearchChanged, SearchClosed
+from zotero_tui.ui.events import SearchChanged, SearchClosed, SelectionChanged
 from zotero_tui.ui.screens.attachment_menu import AttachmentMenu
 from zotero_tui.ui.widget.item_table import SORT_ORDERING, ZoteroTable
+from zotero_tui.ui.widget.perf_overlay import PerfOverlay
 from zotero_tui.ui.widget.search_bar import SearchBar
 from zotero_tui.ui.widget.status_bar import StatusBar
-from zotero_tui.utils.system import open_file
+from zotero_tui.utils.profiling import PROFILER
+from zotero_tui.utils.system import ProcessLauncher
+
+if TYPE_CHECKING:
+  from zotero_tui.database.duplicates import DuplicateGroup
 
 
 class ZoteroApp(App):
   CSS_PATH = "styles.tcss"
   UPDATE_RATE = 10.0
+  MAX_BATCH_OPEN = 25  # Opening more files than this at once is likely a mistake
 
   # VIM BINDINGS
   BINDINGS = [
@@ -36,16 +45,29 @@ class ZoteroApp(App):
     # Search
     Binding("/", "focus_search", "Search", show=True),
     Binding("escape", "cancel_search", "Normal Mode", show=False),
+    # Multi-selection
+    Binding("v", "toggle_visual", "Visual", show=True),
+    Binding("space", "toggle_select", "Select", show=False),
     # Extract information
     Binding("V", "view_pdf", "View PDF", show=True),
     Binding("y", "yank_bibtex", "Yank BibTeX", show=True),
     # Sorting
     Binding("s", "cycle_sort", "Cycle Sort", show=True),
+    # Library maintenance
+    Binding("D", "find_duplicates", "Duplicates", show=False),
+    # Diagnostics
+    Binding("P", "toggle_perf", "Perf Overlay", show=False),
   ]
 
-  def __init__(self, db: ZoteroDB) -> None:
+  def __init__(
+    self, db: ZoteroDB, attachment_index: AttachmentIndex | None = None
+  ) -> None:
     super().__init__()
     self.db = db
+    self.attachment_index = attachment_index or AttachmentIndex(
+      AttachmentResolver.from_config(db.data_dir)
+    )
+    self.launcher = ProcessLauncher()
     self.item_data = self._get_item_data()
     self.sort_order = next(SORT_ORDERING)
 
@@ -53,9 +75,10 @@ class ZoteroApp(App):
   def compose(self) -> ComposeResult:
     """Basically the setup + layout of the TUI."""
     with Horizontal(id="container"):
-      yield ZoteroTable(id="main-table")
+      yield ZoteroTable(self.attachment_index, id="main-table")
       yield Static(id="detail-panel")
 
+    yield PerfOverlay(id="perf-overlay")
     yield SearchBar(id="search-bar")
     yield Footer()
     yield StatusBar(id="status-bar")
@@ -67,21 +90,31 @@ class ZoteroApp(App):
     table = self.query_one(ZoteroTable)
     table.load_data(items, self.sort_order)
     table.focus()
+    self._check_attachments()
 
     status_bar = self.query_one(StatusBar)
     status_bar.update_all(self.sort_order.display_str, total, total)
 
     self.set_interval(self.UPDATE_RATE, self.check_for_table_update)
 
+  def on_unmount(self) -> None:
+    self.attachment_index.shutdown()
+    self.launcher.shutdown()
+
   # --- Update Table ---
   async def check_for_table_update(self) -> None:
     """Polling function for update checks."""
     if self.db.has_update():
       self.notify("Database change detected! Refreshing...", title="Zotero Sync")
       self.reload_library_data()
+      self._check_attachments()
 
   def reload_library_data(self) -> None:
     """Library reload function. Also keeps search the same."""
+    with PROFILER.span("reload"):
+      self._reload_library_data()
+
+  def _reload_library_data(self) -> None:
     self.item_data = self._get_item_data()
 
     query = self.query_one("#search-input", Input)
@@ -112,6 +145,11 @@ class ZoteroApp(App):
     """Cleanup when search finishes."""
     self.remove_class("searching")
 
+  def on_selection_changed(self, message: SelectionChanged) -> None:
+    status_bar = self.query_one(StatusBar)
+    status_bar.selected = message.count
+    status_bar.visual_mode = message.visual
+
   def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
     """Update the abstract panel when moving with j/k."""
     if event.row_key is None or event.row_key.value is None:
@@ -171,36 +209,65 @@ class ZoteroApp(App):
     bar = self.query_one(SearchBar)
     if bar.display:
       bar.close_search()  # This triggers the cleanup via message
+    else:
+      self.query_one(ZoteroTable).clear_selection()
 
-  def action_view_pdf(self) -> None:
-    """Placeholder for opening external PDF viewer."""
-    table = self.query_one(ZoteroTable)
-    cell_key = table.coordinate_to_cell_key(table.cursor_coordinate)
-    if cell_key.row_key is None or cell_key.row_key.value is None:
-      return
+  def action_toggle_visual(self) -> None:
+    """Start/end selecting a range of rows (Vim v)."""
+    self.query_one(ZoteroTable).toggle_visual()
 
-    item_id = int(cell_key.row_key.value)
-    item = self.item_data[item_id]
-    self._handle_pdf_launch(item)
+  def action_toggle_select(self) -> None:
+    """Add/remove the current row from the selection."""
+    self.query_one(ZoteroTable).toggle_current()
+
+  def action_view_pdf(self) -> None:
+    """Opens the PDF of the current item, or of every selected item."""
+    items = self._target_items()
+    if len(items) == 1 and not self.query_one(ZoteroTable).selected:
+      self._handle_pdf_launch(items[0])
+    elif items:
+      self._open_batch(items)
 
   def action_yank_bibtex(self) -> None:
-    """Yanks bibtex of item into clipboard."""
-    table = self.query_one(ZoteroTable)
+    """Yanks bibtex of the current item, or of every selected item."""
+    items = self._target_items()
+    if not items:
+      return
 
-    cell_key = table.coordinate_to_cell_key(table.cursor_coordinate)
-    if cell_key.row_key is None or cell_key.row_key.value is None:
+    bib_string, skipped = items_to_bibtex(items)
+    if not bib_string:
+      self.notify(
+        f"Type '{skipped[0].item_type}' not supported yet.",
+        title="BibTeX Error",
+        severity="error",
+      )
       return
 
-    item_id = int(cell_key.row_key.value)
-    item = self.item_data[item_id]
     try:
-      bib_string = item.to_bibtex()
+      import pyperclip  # Only needed on copy
+
       pyperclip.copy(bib_string)
-      self.notify(f"BibTeX copied to clipboard:\n{bib_string}", title="Yank Successful")
-    except ValueError as e:
-      self.notify(str(e), title="BibTeX Error", severity="error")
     except Exception as e:
       self.notify(f"Clipboard error: {e}", severity="error")
+      return
+
+    if len(items) == 1:
+      self.notify(f"BibTeX copied to clipboard:\n{bib_string}", title="Yank Successful")
+    else:
+      copied = len(items) - len(skipped)
+      message = f"{copied} BibTeX entries copied to clipboard"
+      if skipped:
+        message += f" ({len(skipped)} unsupported skipped)"
+      self.notify(message, title="Yank Successful")
+
+  def action_toggle_perf(self) -> None:
+    """Toggle the performance overlay."""
+    self.query_one(PerfOverlay).toggle()
+
+  def action_find_duplicates(self) -> None:
+    """Searches the library for duplicates in the background."""
+    self.notify("Searching for duplicates...", title="Duplicates")
+    self._find_duplicates()
 
   def action_cycle_sort(self) -> None:
     """Cycle sort options."""
@@ -210,15 +277,116 @@ class ZoteroApp(App):
   # --- Helpers ---
   def _get_item_data(self) -> dict[int, ZoteroItem]:
     """Gets item data from DB."""
-    with self.db.connect() as conn:
+    with PROFILER.span("db.fetch"), self.db.connect() as conn:
       items = list(fetch_all_items(conn))
 
     return {item.item_id: item for item in items}
 
+  def _check_attachments(self) -> None:
+    """Re-checks attachment files in the background, then updates the table."""
+    table = self.query_one(ZoteroTable)
+
+    def on_done() -> None:
+      try:
+        self.call_from_thread(table.refresh_attachment_column)
+      except RuntimeError:
+        pass  # App already closed
+
+    self.attachment_index.refresh(self.item_data.values(), on_done)
+
+  @work(thread=True, exclusive=True, group="duplicates")
+  def _find_duplicates(self) -> None:
+    # Imported lazily: pulls in multiprocessing, only needed on demand
+    from zotero_tui.database.duplicates import find_duplicates
+
+    groups = find_duplicates(list(self.item_data.values()))
+    self.call_from_thread(self._show_duplicates, groups)
+
+  def _show_duplicates(self, groups: list["DuplicateGroup"]) -> None:
+    from zotero_tui.ui.screens.duplicates import DuplicatesScreen
+
+    if not groups:
+      self.notify("No duplicates found", title="Duplicates")
+      return
+
+    self.push_screen(DuplicatesScreen(groups), self._jump_to_item)
+
+  def _jump_to_item(self, item_id: int | None) -> None:
+    """Moves the table cursor to an item, if it is currently listed."""
+    if item_id is None:
+      return
+
+    table = self.query_one(ZoteroTable)
+    try:
+      table.move_cursor(row=table.get_row_index(str(item_id)))
+    except RowDoesNotExist:
+      self.notify("Item is hidden by the current search", severity="warning")
+
+  def _target_items(self) -> list[ZoteroItem]:
+    """Selected items if there are any, otherwise the item under the cursor."""
+    table = self.query_one(ZoteroTable)
+    if table.selected:
+      return table.selected_items()
+
+    if not table.row_count:
+      return []
+
+    cell_key = table.coordinate_to_cell_key(table.cursor_coordinate)
+    if cell_key.row_key is None or cell_key.row_key.value is None:
+      return []
+
+    return [self.item_data[int(cell_key.row_key.value)]]
+
+  def _open_batch(self, items: list[ZoteroItem]) -> None:
+    """Opens the first available attachment of each item."""
+    to_open: list[tuple[Path, bool]] = []
+    for item in items:
+      choice = self._pick_attachment(item)
+      if choice is not None:
+        to_open.append(choice)
+
+    if not to_open:
+      self.notify("No PDFs found for the selection", severity="error")
+      return
+
+    # Paths are grouped by whether they still need an existence check
+    batch = to_open[: self.MAX_BATCH_OPEN]
+    for verify in (False, True):
+      paths = [path for path, needs_check in batch if needs_check == verify]
+      self.launcher.open(paths, self._report_open_error, verify=verify)
+
+    message = f"Opening {len(batch)} attachment{'s' if len(batch) != 1 else ''}"
+    if len(to_open) > len(batch):
+      message += f" (limited to the first {self.MAX_BATCH_OPEN})"
+    self.notify(message)
+
+  def _pick_attachment(self, item: ZoteroItem) -> tuple[Path, bool] | None:
+    """First PDF known to exist, else one still being checked."""
+    pending = None
+    for attachment in item.attachments:
+      if not attachment.is_pdf:
+        continue
+      path = self.attachment_index.path_for(attachment)
+      status = self.attachment_index.status(attachment)
+      if status is None:
+        pending = pending or (path, True)
+      elif status.exists:
+        return path, False
+
+    return pending
+
+  def _report_open_error(self, _: Path, error: Exception) -> None:
+    """Called from a launcher thread."""
+    try:
+      self.call_from_thread(self.notify, str(error), severity="error")
+    except RuntimeError:
+      pass  # App already closed
+
   def _handle_pdf_launch(self, item: ZoteroItem) -> None:
     """Handler for opening PDFs."""
     if not item.attachments:
       self.notify("No PDF attached", severity="error")
+      return
 
     if len(item.attachments) == 1:
       # Single attachment? Open immediately
@@ -233,11 +401,12 @@ class ZoteroApp(App):
 
   def _open_attachment(self, attachment: Attachment) -> None:
     """Open attachement helper."""
-    storage_base = Path("~/Zotero/storage").expanduser()
-    full_path = attachment.get_absolute_path(storage_base)
+    full_path = self.attachment_index.path_for(attachment)
+    status = self.attachment_index.status(attachment)
+    if status is not None and not status.exists:
+      self.notify(f"No file found at {full_path}", severity="error")
+      return
 
-    try:
-      open_file(full_path)
-      self.notify(f"Opening attachments for: {attachment.path.name}")
-    except Exception as e:
-      self.notify(str(e), severity="error")
+    # Only stat if the background check has not finished yet
+    self.launcher.open([full_path], self._report_open_error, verify=status is None)
+    self.notify(f"Opening attachments for: {attachment.path.name}")
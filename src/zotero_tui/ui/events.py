@@ -11,3 +11,12 @@ class SearchChanged(Message):
 
 class SearchClosed(Message):
   """Sent when the search bar is closed (Accepted or Cancelled)."""
+
+
+class SelectionChanged(Message):
+  """Sent when the table's multi-selection or visual mode changes."""
+
+  def __init__(self, count: int, visual: bool) -> None:
+    self.count = count
+    self.visual = visual
+    super().__init__()
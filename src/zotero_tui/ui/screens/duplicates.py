@@ -0,0 +1,58 @@
+from textual.app import ComposeResult
+from textual.binding import Binding
+from textual.screen import Screen
+from textual.widgets import DataTable, Label
+
+from zotero_tui.database.duplicates import DuplicateGroup
+
+
+class DuplicatesScreen(Screen[int | None]):
+  """Lists groups of likely duplicate items. Returns the selected item id."""
+
+  BINDINGS = [
+    Binding("j", "cursor_down", "Down", show=False),
+    Binding("k", "cursor_up", "Up", show=False),
+    Binding("escape,q", "close", "Close", show=False),
+  ]
+
+  def __init__(self, groups: list[DuplicateGroup]):
+    super().__init__()
+    self.groups = groups
+
+  def compose(self) -> ComposeResult:
+    n_items = sum(len(group.items) for group in self.groups)
+    yield Label(
+      f"{len(self.groups)} duplicate groups ({n_items} items)", id="duplicates-title"
+    )
+    yield DataTable(id="duplicates-table", cursor_type="row")
+    yield Label("j/k: Navigate | Enter: Go to item | Esc: Close", id="dialog-footer")
+
+  def on_mount(self) -> None:
+    table = self.query_one(DataTable)
+    table.add_columns("Group", "Match", "Year", "Author", "Title")
+    for n, group in enumerate(self.groups, start=1):
+      for position, item in enumerate(group.items):
+        # Only label the first row of each group
+        first = position == 0
+        table.add_row(
+          str(n) if first else "",
+          f"{group.reason} {group.score:.0f}" if first else "",
+          str(item.year) if item.year > 0 else "----",
+          item.author_summary,
+          item.title,
+          key=str(item.item_id),
+        )
+    table.focus()
+
+  def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
+    if event.row_key.value is not None:
+      self.dismiss(int(event.row_key.value))
+
+  def action_cursor_down(self) -> None:
+    self.query_one(DataTable).action_cursor_down()
+
+  def action_cursor_up(self) -> None:
+    self.query_one(DataTable).action_cursor_up()
+
+  def action_close(self) -> None:
+    self.dismiss(None)
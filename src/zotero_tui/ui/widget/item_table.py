@@ -1,38 +1,69 @@
+import time
 from itertools import cycle
-from typing import Any, Callable, NamedTuple
+from typing import Any, Callable, Iterator, NamedTuple
 
 from textual.widgets import DataTable
 
+from zotero_tui.database.attachments import AttachmentIndex, AttachmentState
 from zotero_tui.database.models import ZoteroItem
+from zotero_tui.database.search import RankedResults
+from zotero_tui.ui.events import SelectionChanged
+from zotero_tui.utils.profiling import PROFILER
 
 
 class SortOrder(NamedTuple):
   display_str: str
   key_func: Callable[[ZoteroItem], Any]
   reverse: bool
+  ranked: bool = False  # Rank by relevance while searching
 
 
-SORT_ORDERING = cycle(
-  [
-    SortOrder("ID (↓)", lambda x: x.item_id, True),
-    SortOrder("ID (↑)", lambda x: x.item_id, False),
-    SortOrder("Year (↓)", lambda x: x.year, True),
-    SortOrder("Year (↑)", lambda x: x.year, False),
-    SortOrder("Title (↓)", lambda x: x.title, True),
-    SortOrder("Title (↑)", lambda x: x.title, False),
-  ]
-)
+SORT_ORDERS = [
+  SortOrder("ID (↓)", lambda x: x.item_id, True),
+  SortOrder("ID (↑)", lambda x: x.item_id, False),
+  SortOrder("Year (↓)", lambda x: x.year, True),
+  SortOrder("Year (↑)", lambda x: x.year, False),
+  SortOrder("Title (↓)", lambda x: x.title, True),
+  SortOrder("Title (↑)", lambda x: x.title, False),
+  # Without a query, relevance falls back to most recent first
+  SortOrder("Relevance", lambda x: x.year, True, ranked=True),
+]
+
+SORT_ORDERING = cycle(SORT_ORDERS)
+
+
+SELECTED_MARK = "▌"
+
+ATTACHMENT_GLYPHS = {
+  AttachmentState.NONE: "",
+  AttachmentState.PENDING: "…",
+  AttachmentState.PRESENT: "●",
+  AttachmentState.MISSING: "✗",
+}
 
 
 class ZoteroTable(DataTable):
   """A DataTable that handles its own filtering logic."""
 
-  def __init__(self, **kwargs: Any):
+  FIRST_PAGE = 100  # Ranked rows shown before the rest streams in
+  STREAM_BATCH = 500
+
+  def __init__(self, attachment_index: AttachmentIndex | None = None, **kwargs: Any):
     super().__init__(**kwargs)
+    self.attachment_index = attachment_index
     self.master_items: list[ZoteroItem] = []
+    self.items_by_id: dict[int, ZoteroItem] = {}
+    self._generation = 0  # Bumped per filter to stop stale row streams
+
+    # Multi-selection (item ids); kept across filtering and sorting
+    self.selected: set[int] = set()
+    self._visual_anchor: int | None = None  # Row index where visual mode began
+    self._visual_base: set[int] = set()  # Selection before visual mode began
 
   def on_mount(self) -> None:
     self.cursor_type = "row"
+    self.add_column("", key="sel", width=1)
+    self.add_column("PDF", key="pdf", width=3)
     self.add_columns("Year", "Author", "Title")
 
   def load_data(
@@ -40,21 +71,169 @@ class ZoteroTable(DataTable):
   ) -> None:
     """Initial data load."""
     self.master_items = items
+    self.items_by_id = {item.item_id: item for item in items}
+    self.selected &= self.items_by_id.keys()  # Drop items that no longer exist
     self.apply_filter("", sort_order)
 
+  def attachment_glyph(self, item: ZoteroItem) -> str:
+    """Has PDF / missing marker, read from the attachment cache."""
+    if self.attachment_index is None:
+      return ""
+    return ATTACHMENT_GLYPHS[self.attachment_index.item_state(item)]
+
+  def refresh_attachment_column(self) -> None:
+    """Updates the PDF column in place once background checks land."""
+    for row_key in self.rows:
+      if row_key.value is None:
+        continue
+
+      item = self.items_by_id.get(int(row_key.value))
+      if item is not None:
+        self.update_cell(row_key, "pdf", self.attachment_glyph(item))
+
+  # --- Selection ---
+  @property
+  def visual_mode(self) -> bool:
+    return self._visual_anchor is not None
+
+  def selected_items(self) -> list[ZoteroItem]:
+    """Selected items in table order; hidden ones (by search) come last."""
+    listed = [int(row.key.value) for row in self.ordered_rows if row.key.value]
+    hidden = sorted(self.selected.difference(listed))
+    return [
+      self.items_by_id[item_id]
+      for item_id in [*listed, *hidden]
+      if item_id in self.selected and item_id in self.items_by_id
+    ]
+
+  def toggle_visual(self) -> None:
+    """Starts/ends vim-style visual mode; the range is kept on exit."""
+    if self.visual_mode:
+      self._visual_anchor = None
+      self._post_selection()
+    elif self.row_count:
+      self._visual_anchor = self.cursor_row
+      self._visual_base = set(self.selected)
+      self._update_visual()
+
+  def toggle_current(self) -> None:
+    """Adds/removes the row under the cursor."""
+    if not self.row_count:
+      return
+
+    row_key = self.ordered_rows[self.cursor_row].key
+    if row_key.value is not None:
+      self._set_selection(self.selected ^ {int(row_key.value)})
+
+  def clear_selection(self) -> bool:
+    """Leaves visual mode and unselects everything. False if nothing to do."""
+    if not self.selected and not self.visual_mode:
+      return False
+
+    self._visual_anchor = None
+    self._set_selection(set())
+    return True
+
+  def on_data_table_row_highlighted(self, _: DataTable.RowHighlighted) -> None:
+    if self.visual_mode:
+      self._update_visual()
+
+  def _update_visual(self) -> None:
+    assert self._visual_anchor is not None
+    low, high = sorted((self._visual_anchor, self.cursor_row))
+    in_range = {
+      int(row.key.value)
+      for row in self.ordered_rows[low : high + 1]
+      if row.key.value is not None
+    }
+    self._set_selection(self._visual_base | in_range)
+
+  def _set_selection(self, selected: set[int]) -> None:
+    """Updates the selection, redrawing only rows whose mark changed."""
+    changed = selected ^ self.selected
+    self.selected = selected
+    for item_id in changed:
+      row_key = str(item_id)
+      if row_key in self.rows:
+        mark = SELECTED_MARK if item_id in selected else ""
+        self.update_cell(row_key, "sel", mark)
+
+    self._post_selection()
+
+  def _post_selection(self) -> None:
+    self.post_message(SelectionChanged(len(self.selected), self.visual_mode))
+
+  # --- Filtering ---
   def apply_filter(self, query: str, sort_order: SortOrder | None = None) -> int:
     """Clears the table and re-adds rows based on query."""
     self.clear()
-    filtered = [item for item in self.master_items if item.is_query_match(query)]
-    if sort_order:
-      filtered = sorted(filtered, key=sort_order.key_func, reverse=sort_order.reverse)
+    self._generation += 1
+    if self.visual_mode:
+      # Row indices change, so keep the selection but leave visual mode
+      self._visual_anchor = None
+      self._post_selection()
+
+    if query and sort_order and sort_order.ranked:
+      found = self._apply_ranked_filter(query)
+    else:
+      with PROFILER.span("filter"):
+        filtered = [item for item in self.master_items if item.is_query_match(query)]
+
+      if sort_order:
+        with PROFILER.span("sort"):
+          filtered = sorted(
+            filtered, key=sort_order.key_func, reverse=sort_order.reverse
+          )
+
+      with PROFILER.span("table.rebuild"):
+        self._add_item_rows(filtered)
+      found = len(filtered)
+
+    if PROFILER.enabled:
+      # Time until the next screen refresh approximates the render cost
+      start = time.perf_counter()
+      self.call_after_refresh(
+        lambda: PROFILER.record("render", time.perf_counter() - start, start)
+      )
+
+    return found
 
-    for item in filtered:
+  def _apply_ranked_filter(self, query: str) -> int:
+    """Shows the best matches first, then streams in the rest."""
+    with PROFILER.span("filter"):
+      results = RankedResults(self.master_items, query)
+
+    with PROFILER.span("sort"):
+      first_page = results.top(self.FIRST_PAGE)
+
+    with PROFILER.span("table.rebuild"):
+      self._add_item_rows(first_page)
+
+    if len(results) > len(first_page):
+      batches = results.stream(self.STREAM_BATCH)
+      self.call_after_refresh(self._stream_rows, batches, self._generation)
+
+    return len(results)
+
+  def _stream_rows(self, batches: Iterator[list[ZoteroItem]], generation: int) -> None:
+    """Adds one batch per refresh until done or a newer filter starts."""
+    if generation != self._generation:
+      return
+
+    batch = next(batches, None)
+    if batch is None:
+      return
+
+    self._add_item_rows(batch)
+    self.call_after_refresh(self._stream_rows, batches, generation)
+
+  def _add_item_rows(self, items: list[ZoteroItem]) -> None:
+    for item in items:
       self.add_row(
+        SELECTED_MARK if item.item_id in self.selected else "",
+        self.attachment_glyph(item),
         str(item.year) if item.year > 0 else "----",
         item.author_summary,
         item.title,
         key=str(item.item_id),
       )
-
-    return len(filtered)
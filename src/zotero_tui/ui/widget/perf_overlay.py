@@ -0,0 +1,38 @@
+from textual.widgets import Static
+
+from zotero_tui.utils.profiling import PROFILER
+
+
+class PerfOverlay(Static):
+  """Shows p50/p95 timings per stage from the span recorder."""
+
+  UPDATE_RATE = 1.0
+
+  def on_mount(self) -> None:
+    self.display = False
+    self._keep_recording = PROFILER.enabled  # e.g. enabled through env var
+    self._timer = self.set_interval(self.UPDATE_RATE, self.refresh_stats, pause=True)
+
+  def toggle(self) -> None:
+    """Shows/hides the overlay. Recording is only switched on while shown."""
+    self.display = not self.display
+    if self.display:
+      PROFILER.enabled = True
+      self.refresh_stats()
+      self._timer.resume()
+    else:
+      PROFILER.enabled = self._keep_recording
+      self._timer.pause()
+
+  def refresh_stats(self) -> None:
+    stats = PROFILER.stats()
+    if not stats:
+      self.update("[b]Performance[/b]\n\nNo spans recorded yet.")
+      return
+
+    width = max(len(name) for name in stats)
+    lines = [f"[b]{'stage':<{width}}  {'n':>5}  {'p50 ms':>8}  {'p95 ms':>8}[/b]"]
+    for name, s in sorted(stats.items()):
+      lines.append(f"{name:<{width}}  {s.count:>5}  {s.p50:>8.2f}  {s.p95:>8.2f}")
+
+    self.update("\n".join(lines))
@@ -8,6 +8,8 @@ class StatusBar(Static):
   sort_description: reactive[str] = reactive("ID (↓)")
   found: reactive[int] = reactive(0)
   total: reactive[int] = reactive(0)
+  selected: reactive[int] = reactive(0)
+  visual_mode: reactive[bool] = reactive(False)
 
   def watch_sort_description(self, _: str) -> None:
     self._update_display()
@@ -18,10 +20,19 @@ class StatusBar(Static):
   def watch_total(self, _: int) -> None:
     self._update_display()
 
+  def watch_selected(self, _: int) -> None:
+    self._update_display()
+
+  def watch_visual_mode(self, _: bool) -> None:
+    self._update_display()
+
   def _update_display(self) -> None:
-    self.update(
-      f"Sort: {self.sort_description}  |  [b]{self.found}[/b] / {self.total} items"
-    )
+    text = f"Sort: {self.sort_description}  |  [b]{self.found}[/b] / {self.total} items"
+    if self.selected:
+      text += f"  |  [b]{self.selected}[/b] selected"
+    if self.visual_mode:
+      text = f"[b]-- VISUAL --[/b]  {text}"
+    self.update(text)
 
   def update_all(self, sort_desc: str, found: int, total: int) -> None:
     self.sort_description = sort_desc
@@ -0,0 +1,107 @@
+import json
+import os
+import time
+from collections import deque
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import ContextManager, Generator, NamedTuple
+
+
+PROFILE_ENV = "ZOTERO_TUI_PROFILE"  # "spans" or "cprofile"
+PROFILE_OUT_ENV = "ZOTERO_TUI_PROFILE_OUT"
+
+DEFAULT_OUT = {
+  "spans": Path("zotero-tui-spans.json"),
+  "cprofile": Path("zotero-tui.prof"),
+}
+
+_NO_SPAN = nullcontext()
+
+
+class Span(NamedTuple):
+  name: str
+  start: float  # perf_counter() seconds
+  duration: float  # seconds
+
+
+class StageStats(NamedTuple):
+  count: int
+  p50: float  # milliseconds
+  p95: float  # milliseconds
+
+
+def _percentile(sorted_values: list[float], pct: float) -> float:
+  """Nearest-rank percentile of an already sorted list."""
+  index = max(0, int(round(pct / 100 * len(sorted_values))) - 1)
+  return sorted_values[index]
+
+
+class SpanRecorder:
+  """
+  Keeps the most recent timing spans in a ring buffer.
+  When disabled, `span` hands back a shared no-op context manager.
+  """
+
+  CAPACITY = 2048
+
+  def __init__(self, capacity: int = CAPACITY, enabled: bool = False) -> None:
+    self.enabled = enabled
+    self.spans: deque[Span] = deque(maxlen=capacity)
+
+  def span(self, name: str) -> ContextManager[None]:
+    if not self.enabled:
+      return _NO_SPAN
+    return self._timed(name)
+
+  @contextmanager
+  def _timed(self, name: str) -> Generator[None, None, None]:
+    start = time.perf_counter()
+    try:
+      yield
+    finally:
+      self.spans.append(Span(name, start, time.perf_counter() - start))
+
+  def record(self, name: str, duration: float, start: float | None = None) -> None:
+    """Records a span that was timed by the caller."""
+    if self.enabled:
+      if start is None:
+        start = time.perf_counter() - duration
+      self.spans.append(Span(name, start, duration))
+
+  def stats(self) -> dict[str, StageStats]:
+    """p50/p95 per stage over the spans currently in the buffer."""
+    by_name: dict[str, list[float]] = {}
+    for span in list(self.spans):
+      by_name.setdefault(span.name, []).append(span.duration * 1000)
+
+    stats = {}
+    for name, durations in by_name.items():
+      durations.sort()
+      stats[name] = StageStats(
+        len(durations), _percentile(durations, 50), _percentile(durations, 95)
+      )
+    return stats
+
+  def dump_json(self, path: Path) -> None:
+    payload = {
+      "spans": [span._asdict() for span in self.spans],
+      "stats": {name: s._asdict() for name, s in self.stats().items()},
+    }
+    path.write_text(json.dumps(payload, indent=2))
+
+  def clear(self) -> None:
+    self.spans.clear()
+
+
+def profile_mode() -> str | None:
+  """Returns the profiling mode requested through the environment."""
+  mode = os.environ.get(PROFILE_ENV, "").strip().lower()
+  return mode if mode in DEFAULT_OUT else None
+
+
+def profile_out_path(mode: str) -> Path:
+  out = os.environ.get(PROFILE_OUT_ENV)
+  return Path(out).expanduser() if out else DEFAULT_OUT[mode]
+
+
+PROFILER = SpanRecorder(enabled=profile_mode() == "spans")
@@ -1,29 +1,100 @@
 import platform
 import subprocess
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
+from typing import Callable, Iterable
 
 
-def open_file(path: Path) -> None:
+def opener_command(path: Path) -> list[str]:
+  """Command that opens `path` with the default system application."""
+  system = platform.system()
+  if system == "Darwin":  # macOS
+    return ["open", str(path)]
+  elif system == "Windows":  # Windows
+    raise NotImplementedError()
+  else:  # Linux (standard)
+    return ["xdg-open", str(path)]
+
+
+def open_file(path: Path, verify: bool = True) -> None:
   """
   Opens a file using the default system application.
-  This is a side-effect-only function.
+  This is a side-effect-only function. Pass `verify=False` when the file is
+  already known to exist to skip the filesystem check.
+
+  The opener is started detached and never waited on: in generic mode,
+  xdg-open runs the viewer in the foreground until it is closed.
   """
-  if not path.exists():
+  if verify and not path.exists():
     raise FileNotFoundError(f"No file found at {path}")
 
-  system = platform.system()
   try:
-    if system == "Darwin":  # macOS
-      subprocess.run(["open", str(path)], check=True)
-    elif system == "Windows":  # Windows
-      raise NotImplementedError()
-    else:  # Linux (standard)
-      subprocess.Popen(
-        ["xdg-open", str(path)],
-        stdout=subprocess.DEVNULL,
-        stderr=subprocess.DEVNULL,
-        start_new_session=True,
-      )
+    subprocess.Popen(
+      opener_command(path),
+      stdout=subprocess.DEVNULL,
+      stderr=subprocess.DEVNULL,
+      start_new_session=True,
+    )
   except Exception as e:
     # Re-raise or handle specific execution errors
     raise RuntimeError(f"Failed to open {path}: {e}")
+
+
+class ProcessLauncher:
+  """
+  Opens files off the UI thread, one at a time and at most one every
+  `interval` seconds. The viewers are detached and not tracked, so the
+  stagger is what keeps a batch from starting them all at once.
+  """
+
+  LAUNCH_INTERVAL = 0.2  # Seconds between two opener launches
+
+  def __init__(self, interval: float = LAUNCH_INTERVAL) -> None:
+    self.interval = interval
+    self._next_launch = 0.0
+    self._closed = threading.Event()
+    self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="zotero-open")
+
+  def open(
+    self,
+    paths: Iterable[Path],
+    on_error: Callable[[Path, Exception], None] | None = None,
+    verify: bool = True,
+  ) -> int:
+    """Queues `paths` for opening. `on_error` runs on a worker thread."""
+    count = 0
+    for path in paths:
+      future = self._executor.submit(self._launch, path, verify)
+      if on_error is not None:
+        future.add_done_callback(self._error_callback(path, on_error))
+      count += 1
+
+    return count
+
+  def _launch(self, path: Path, verify: bool) -> None:
+    # Waiting on the event lets shutdown cut a pending stagger short
+    delay = self._next_launch - time.monotonic()
+    if self._closed.wait(max(delay, 0)):
+      return
+
+    open_file(path, verify)
+    self._next_launch = time.monotonic() + self.interval
+
+  @staticmethod
+  def _error_callback(
+    path: Path, on_error: Callable[[Path, Exception], None]
+  ) -> Callable[[Future[None]], None]:
+    def callback(future: Future[None]) -> None:
+      if future.cancelled():
+        return
+      error = future.exception()
+      if isinstance(error, Exception):
+        on_error(path, error)
+
+    return callback
+
+  def shutdown(self) -> None:
+    self._closed.set()
+    self._executor.shutdown(wait=False, cancel_futures=True)